@@ -12,11 +12,23 @@ This script is retained only for opening tickets in browser.
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 from typing import Optional
 
 
+def _launch(command: list):
+    """Start a URL launcher without waiting for it to finish."""
+    import subprocess
+
+    # Don't inherit stdout, so callers capturing our output don't block on it;
+    # stderr stays attached so launcher errors are still visible
+    subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 def open_ticket_in_browser(issue_key: str, jira_base_url: Optional[str] = None):
     """Open ticket in default browser (Chrome on macOS)."""
     if not jira_base_url:
@@ -28,12 +40,9 @@ def open_ticket_in_browser(issue_key: str, jira_base_url: Optional[str] = None):
 
     if sys.platform == "darwin":
         # macOS - prefer Chrome
-        subprocess.run(
-            ["open", "-a", "Google Chrome", url],
-            check=False,
-        )
+        _launch(["open", "-a", "Google Chrome", url])
     elif sys.platform == "linux":
-        subprocess.run(["xdg-open", url], check=False)
+        _launch(["xdg-open", url])
     else:
         import webbrowser
         webbrowser.open(url)
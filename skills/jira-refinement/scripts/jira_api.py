@@ -6,17 +6,178 @@ Supports Jira Cloud REST API v3.
 
 import os
 import sys
+import base64
+import hashlib
 import json
 import re
-import requests
+import time
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable, Iterator, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 
-# Load environment
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
+# requests, urllib3 and dotenv are imported where they are first needed, so
+# commands that never touch the network (e.g. --help) start quickly.
+
+try:
+    import orjson  # optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+# Fields returned by issue searches
+SEARCH_FIELDS = [
+    "summary", "description", "status", "labels", "priority",
+    "issuetype", "assignee", "reporter", "created", "updated",
+    "customfield_10016",  # Story points (common field ID)
+    "parent", "comment",
+]
+
+# Extra data for full ticket dumps; display only needs the plain fields
+FULL_EXPAND = ("renderedFields", "names", "changelog")
+
+
+def json_pretty(data: Any) -> str:
+    """Serialize data as indented JSON for CLI output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _json_body(payload: Any, sort_keys: bool = False) -> bytes:
+    """Serialize a request body (sent with the session's JSON Content-Type)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(payload, sort_keys=sort_keys, separators=(",", ":")).encode()
+
+
+def _idempotency_key(method: str, url: str, payload: Any) -> str:
+    """Stable key for a write: same request, same key."""
+    digest = hashlib.sha256(f"{method} {url}".encode() + _json_body(payload, sort_keys=True))
+    return digest.hexdigest()[:32]
+
+
+# Markdown links [text](url) or plain URLs, matched in one pass
+_ADF_LINK_RE = re.compile(
+    r'\[(?P<md_text>[^\]]+)\]\((?P<md_url>[^)]+)\)'
+    r'|(?P<url>https?://[^\s<>\[\]]+)'
+)
+
+# Runs of more than one blank line
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# On-disk cache for data that rarely changes between CLI invocations
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-refinement"
+TRANSITIONS_CACHE_TTL = 24 * 60 * 60  # seconds since an entry was fetched
+BACKLOG_CACHE_TTL = 30  # seconds
+TICKET_CACHE_TTL = 30 * 24 * 60 * 60  # seconds since an entry was last used
+
+# Retry policy shared by the requests session and the httpx clients
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+MAX_RETRIES = 5
+BACKOFF_MAX = 30  # seconds
+
+
+def _read_cache_json(name: str, ttl: float) -> Optional[Any]:
+    """Read a cached JSON file, or None if it is missing, unreadable or older than ttl."""
+    path = CACHE_DIR / name
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_json(name: str, data: Any):
+    """Write a JSON cache file; caching is best effort, so failures are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / name).write_text(json.dumps(data))
+    except OSError:
+        pass
+
+
+def _remove_cache_json(name: str):
+    """Delete a JSON cache file if it exists."""
+    try:
+        (CACHE_DIR / name).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+class _TicketCache:
+    """SQLite cache of ticket responses, revalidated with conditional GETs.
+
+    Entries are only stored when Jira sends a validator (ETag or
+    Last-Modified), and are pruned once unused for TICKET_CACHE_TTL; like
+    the JSON caches, failures just disable caching.
+    """
+
+    def __init__(self, path: Path = CACHE_DIR / "tickets.db"):
+        self.path = path
+        self._conn = None
+        self._disabled = False
+        # bulk_get_tickets reads and writes from worker threads
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None and not self._disabled:
+            import sqlite3
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS tickets ("
+                    "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, fetched_at INTEGER)"
+                )
+            except (OSError, sqlite3.Error):
+                self._conn = None
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """Return (etag, last_modified, body) for a cached response, or None."""
+        import sqlite3
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body FROM tickets WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    # A 304 reuses the row, so reads count as use
+                    conn.execute(
+                        "UPDATE tickets SET fetched_at = ? WHERE key = ?", (int(time.time()), key)
+                    )
+                return row
+            except sqlite3.Error:
+                return None
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """Store a response body with its validators, pruning stale entries."""
+        import sqlite3
+
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            now = int(time.time())
+            try:
+                conn.execute("DELETE FROM tickets WHERE fetched_at < ?", (now - TICKET_CACHE_TTL,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO tickets (key, etag, last_modified, body, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, etag, last_modified, body, now),
+                )
+            except sqlite3.Error:
+                pass
 
 
 @dataclass
@@ -29,6 +190,9 @@ class JiraConfig:
 
     @classmethod
     def from_env(cls) -> "JiraConfig":
+        from dotenv import load_dotenv
+        load_dotenv(Path(__file__).parent.parent / ".env")
+
         base_url = os.getenv("JIRA_BASE_URL")
         email = os.getenv("JIRA_EMAIL")
         api_token = os.getenv("JIRA_API_TOKEN")
@@ -46,29 +210,265 @@ class JiraConfig:
             backlog_jql=backlog_jql,
         )
 
+    @property
+    def auth_header(self) -> str:
+        """Authorization header value for Basic auth with the API token."""
+        credentials = base64.b64encode(f"{self.email}:{self.api_token}".encode()).decode()
+        return f"Basic {credentials}"
+
+
+@dataclass(slots=True)
+class BacklogView:
+    """Column-oriented summary of backlog issues, one list per field."""
+    keys: List[str]
+    summaries: List[str]
+    statuses: List[str]
+    labels: List[List[str]]
+    priorities: List[str]
+
+    @classmethod
+    def from_issues(cls, issues: Iterable[Dict[str, Any]]) -> "BacklogView":
+        """Build the columns in a single pass over search results."""
+        view = cls([], [], [], [], [])
+        for issue in issues:
+            fields = issue.get("fields") or {}
+            view.keys.append(issue["key"])
+            view.summaries.append(fields.get("summary") or "")
+            view.statuses.append((fields.get("status") or {}).get("name", ""))
+            view.labels.append(fields.get("labels") or [])
+            view.priorities.append((fields.get("priority") or {}).get("name", ""))
+        return view
+
+
+def _retry_policy():
+    """Retry policy for transient failures (Atlassian Cloud rate limits, gateway errors)."""
+    from urllib3.util import Retry
+
+    class JiraRetry(Retry):
+        """Retry policy that never waits less than its own backoff.
+
+        A `Retry-After: 0` header would otherwise skip the backoff entirely and
+        hammer a rate-limited instance; honour the server hint as a lower bound.
+
+        POST (comments, issue links, transitions) isn't idempotent: a 5xx or a
+        read error may come after Jira applied it, so it is only retried on
+        429 and on failed connects, where nothing reached Jira.
+        """
+
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            if method.upper() == "POST":
+                return status_code == 429
+            return super().is_retry(method, status_code, has_retry_after)
+
+        def get_retry_after(self, response) -> Optional[float]:
+            retry_after = super().get_retry_after(response)
+            if retry_after is None:
+                return None
+            return max(retry_after, self.get_backoff_time())
+
+    return JiraRetry(
+        total=MAX_RETRIES,
+        backoff_factor=1.0,
+        backoff_max=BACKOFF_MAX,
+        backoff_jitter=0.5,
+        status_forcelist=sorted(RETRY_STATUSES),
+        # Read errors and 5xx are only retried for these; see is_retry for POST
+        allowed_methods=frozenset(["GET", "PUT"]),
+        respect_retry_after_header=True,
+    )
+
+
+def _header_auth(auth_header: str):
+    """requests auth that sets a pre-encoded Authorization header."""
+    from requests.auth import AuthBase
+
+    class HeaderAuth(AuthBase):
+        """Sets the Authorization header without re-encoding it per request.
+
+        Setting session.auth also stops requests from looking up (and
+        preferring) ~/.netrc credentials on every call.
+        """
+
+        def __init__(self, header: str):
+            self.header = header
+
+        def __call__(self, r):
+            r.headers["Authorization"] = self.header
+            return r
+
+    return HeaderAuth(auth_header)
+
+
+def _retry_delay(response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying an httpx response, or None if it is final.
+
+    httpx has no status-based retries, so its clients use this to follow the
+    same policy as _retry_policy: jittered exponential backoff, with
+    Retry-After as a lower bound.
+    """
+    import random
+
+    if response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+        return None
+    delay = min(BACKOFF_MAX, 2 ** attempt) + random.uniform(0, 0.5)
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            # HTTP-date form
+            from email.utils import parsedate_to_datetime
+
+            try:
+                delay = max(delay, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return delay
+
+
+class _SearchPager:
+    """Paging state for /search/jql, shared by JiraClient and AsyncJiraClient.
+
+    Iterate over pages() for each page's query params, and pass every
+    response body to advance() before asking for the next page.
+    """
+
+    def __init__(
+        self,
+        jql: str,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ):
+        self.params = {"jql": jql, "fields": ",".join(fields or SEARCH_FIELDS)}
+        self.page_size = page_size
+        self.remaining = limit
+        self.requested = 0
+        self.done = False
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield query params for each page until the results or the limit run out."""
+        while not self.done and (self.remaining is None or self.remaining > 0):
+            self.requested = self.page_size if self.remaining is None else min(self.page_size, self.remaining)
+            yield {**self.params, "maxResults": self.requested}
+
+    def advance(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Record a page's response and return its issues."""
+        issues = data.get("issues", [])
+        next_token = data.get("nextPageToken")
+        if not next_token or data.get("isLast"):
+            self.done = True
+            return issues
+        if 0 < len(issues) < self.requested:
+            # Server capped the page size; match it so later pages aren't short too
+            print(
+                f"Warning: Jira returned {len(issues)} of {self.requested} requested issues per page",
+                file=sys.stderr,
+            )
+            self.page_size = len(issues)
+        self.params["nextPageToken"] = next_token
+        if self.remaining is not None:
+            self.remaining -= len(issues)
+        return issues
+
 
 class JiraClient:
     """Jira Cloud REST API client."""
 
     def __init__(self, config: Optional[JiraConfig] = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import make_headers
+
         self.config = config or JiraConfig.from_env()
         self.session = requests.Session()
-        self.session.auth = (self.config.email, self.config.api_token)
+        # Retry transient failures; one host, so few pools, but a deep pool keeps
+        # keep-alive sockets for parallel fetches
+        adapter = HTTPAdapter(
+            max_retries=_retry_policy(), pool_connections=4, pool_maxsize=32, pool_block=False
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Pace requests from the X-RateLimit-* headers instead of waiting for 429s.
+        # Buckets map account id -> (tokens, fill rate per second, capacity, last update)
+        self._buckets: Dict[str, Tuple[float, float, float, float]] = {}
+        self._rate_key: Optional[str] = None
+        self._rate_lock = threading.Lock()
+        self.session.hooks["response"] = [self._track_ratelimit]
+        # HTTP/2 client for parallel fan-out, created on first use (see _http2_client)
+        self._h2_client = None
+        # Backlog order from the last backlog query: (time.monotonic(), issue keys)
+        self._backlog_cache: Optional[Tuple[float, List[str]]] = None
+        # Ticket responses kept across CLI runs, revalidated with If-None-Match/If-Modified-Since
+        self._ticket_cache = _TicketCache()
+        # Issue types and workflow transitions, loaded lazily from the disk cache
+        self._transitions_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._transitions_lock = threading.RLock()
+        # Basic auth header encoded once, rather than by requests on every call
+        self.session.auth = _header_auth(self.config.auth_header)
         self.session.headers.update({
             "Accept": "application/json",
+            # Ask for compressed responses in every encoding urllib3 can decode here
+            # (gzip/deflate always; br and zstd when brotli/zstandard are installed)
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
         })
 
+    def _track_ratelimit(self, response, *args, **kwargs):
+        """Response hook: refresh the token bucket from Jira's rate limit headers."""
+        headers = response.headers
+        try:
+            fill_rate = float(headers["X-RateLimit-FillRate"])
+            interval = float(headers["X-RateLimit-Interval-Seconds"])
+            capacity = float(headers.get("X-RateLimit-Limit") or fill_rate)
+        except (KeyError, ValueError):
+            return
+        if fill_rate <= 0 or interval <= 0:
+            return
+
+        key = headers.get("X-AAccountId") or self.config.email
+        remaining = headers.get("X-RateLimit-Remaining")
+        tokens = self._buckets.get(key, (capacity,))[0]
+        if remaining is not None:
+            try:
+                tokens = float(remaining)
+            except ValueError:
+                pass
+
+        with self._rate_lock:
+            self._buckets[key] = (tokens, fill_rate / interval, capacity, time.monotonic())
+            self._rate_key = key
+
+    def _acquire(self):
+        """Take a token from the rate limit bucket, sleeping until one is available."""
+        with self._rate_lock:
+            bucket = self._buckets.get(self._rate_key) if self._rate_key else None
+            if bucket is None:
+                return
+
+            tokens, rate, capacity, last_ts = bucket
+            now = time.monotonic()
+            tokens = min(capacity, tokens + (now - last_ts) * rate) - 1
+            self._buckets[self._rate_key] = (tokens, rate, capacity, now)
+        # Sleep outside the lock; the token is already reserved
+        if tokens < 0:
+            time.sleep(-tokens / rate)
+
     def _api_url(self, path: str) -> str:
-        """Build full API URL."""
+        """Build full API URL (pacing the request that is about to use it)."""
+        self._acquire()
         return f"{self.config.base_url}/rest/api/3/{path.lstrip('/')}"
 
     def _agile_url(self, path: str) -> str:
-        """Build Agile API URL."""
+        """Build Agile API URL (pacing the request that is about to use it)."""
+        self._acquire()
         return f"{self.config.base_url}/rest/agile/1.0/{path.lstrip('/')}"
 
     def test_connection(self) -> bool:
         """Test Jira connection."""
+        import requests
+
         try:
             response = self.session.get(self._api_url("myself"))
             response.raise_for_status()
@@ -79,38 +479,174 @@ class JiraClient:
             print(f"Connection failed: {e}")
             return False
 
-    def search_issues(self, jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
-        """Search for issues using JQL."""
-        fields = [
-            "summary", "description", "status", "labels", "priority",
-            "issuetype", "assignee", "reporter", "created", "updated",
-            "customfield_10016",  # Story points (common field ID)
-            "parent", "comment",
-        ]
-        # Use the new /search/jql endpoint (POST /search is deprecated - 410 Gone)
-        response = self.session.get(
-            self._api_url("search/jql"),
-            params={
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": ",".join(fields),
-            },
-        )
-        response.raise_for_status()
-        return response.json().get("issues", [])
+    def search_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Search for issues using JQL, yielding them one page at a time.
+
+        Follows nextPageToken until the results (or `limit` issues) run out.
+        Only the given fields are returned (default: SEARCH_FIELDS).
+        """
+        pager = _SearchPager(jql, page_size, limit, fields)
+        for params in pager.pages():
+            # Use the new /search/jql endpoint (POST /search is deprecated - 410 Gone)
+            response = self.session.get(self._api_url("search/jql"), params=params)
+            response.raise_for_status()
+            yield from pager.advance(response.json())
 
     def get_backlog_tickets(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get non-ready tickets from backlog."""
-        return self.search_issues(self.config.backlog_jql, max_results=limit)
+        issues = list(self.search_issues(self.config.backlog_jql, limit=limit))
+        self._remember_backlog([issue["key"] for issue in issues])
+        self._note_issue_types(issues)
+        return issues
+
+    def _remember_backlog(self, keys: List[str]):
+        """Keep the backlog order briefly, in memory and on disk for the next CLI run."""
+        self._backlog_cache = (time.monotonic(), keys)
+        _write_cache_json(
+            "backlog.json",
+            {"base_url": self.config.base_url, "jql": self.config.backlog_jql, "keys": keys},
+        )
+
+    def _recent_backlog(self) -> Optional[List[str]]:
+        """Backlog keys fetched within BACKLOG_CACHE_TTL, or None."""
+        if self._backlog_cache and time.monotonic() - self._backlog_cache[0] < BACKLOG_CACHE_TTL:
+            return self._backlog_cache[1]
+        cached = _read_cache_json("backlog.json", BACKLOG_CACHE_TTL)
+        # Only reuse an order fetched from the same site with the same query
+        if (
+            cached
+            and cached.get("base_url") == self.config.base_url
+            and cached.get("jql") == self.config.backlog_jql
+        ):
+            return cached.get("keys")
+        return None
+
+    def _http2_client(self):
+        """Shared HTTP/2 client for parallel requests, or None if httpx[http2] isn't installed.
+
+        Concurrent requests are multiplexed as streams over one TLS connection
+        instead of each holding its own HTTP/1.1 socket.
+        """
+        if self._h2_client is None:
+            try:
+                import h2  # noqa: F401 - required by httpx for http2=True
+                import httpx
+            except ImportError:
+                return None
+            self._h2_client = httpx.Client(
+                http2=True,
+                headers={
+                    "Authorization": self.config.auth_header,
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+                timeout=httpx.Timeout(30, connect=5),
+                limits=httpx.Limits(max_connections=8),
+                event_hooks={"response": [self._track_ratelimit]},
+            )
+        return self._h2_client
+
+    def _h2_get(self, url: str, **kwargs):
+        """GET over the HTTP/2 client, retrying 429/5xx like the requests session does."""
+        import httpx
+
+        attempt = 0
+        while True:
+            try:
+                response = self._h2_client.get(url, **kwargs)
+            except httpx.ConnectError:
+                if attempt >= MAX_RETRIES:
+                    raise
+                time.sleep(min(BACKOFF_MAX, 2 ** attempt))
+                attempt += 1
+                continue
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get_ticket(self, issue_key: str, expand: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """Get ticket details, optionally expanding extra data (see FULL_EXPAND)."""
+        ticket = self._get_ticket(self.session.get, issue_key, expand)
+        self._note_issue_types([ticket])
+        return ticket
+
+    def _get_ticket(self, get, issue_key: str, expand: Tuple[str, ...]) -> Dict[str, Any]:
+        """Get ticket details using the given GET function (session.get or _h2_get)."""
+        url = self._api_url(f"issue/{issue_key}")
+        cache_key = f"{url}?expand={','.join(expand)}"
+        cached = self._ticket_cache.get(cache_key)
+
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = get(
+            url,
+            params={"expand": ",".join(expand)} if expand else None,
+            headers=headers or None,
+        )
+        if response.status_code == 304 and cached:
+            # Unchanged since we cached it
+            ticket = json.loads(cached[2])
+        else:
+            response.raise_for_status()
+            self._ticket_cache.put(
+                cache_key,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.content,
+            )
+            ticket = response.json()
+        return ticket
+
+    def write_ticket_json(self, issue_key: str, out, expand: Tuple[str, ...] = FULL_EXPAND):
+        """Copy a ticket's JSON, as sent by Jira, to a binary file object.
+
+        The body is streamed without being parsed, so large changelogs are
+        never held in memory.
+        """
+        import shutil
 
-    def get_ticket(self, issue_key: str) -> Dict[str, Any]:
-        """Get full ticket details."""
         response = self.session.get(
             self._api_url(f"issue/{issue_key}"),
-            params={"expand": "renderedFields,names,changelog"},
+            params={"expand": ",".join(expand)} if expand else None,
+            stream=True,
         )
-        response.raise_for_status()
-        return response.json()
+        with response:
+            response.raise_for_status()
+            # Undo gzip/br content encoding while streaming
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, out)
+
+    def bulk_get_tickets(
+        self, issue_keys: List[str], workers: int = 5, expand: Tuple[str, ...] = ()
+    ) -> List[Dict[str, Any]]:
+        """Get details for several tickets in parallel, preserving order.
+
+        Uses one multiplexed HTTP/2 connection when httpx[http2] is installed,
+        otherwise the pooled requests session.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        get = self._h2_get if self._http2_client() else self.session.get
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            tickets = list(executor.map(lambda key: self._get_ticket(get, key, expand), issue_keys))
+        # Once for the batch, not from each worker
+        self._note_issue_types(tickets)
+        return tickets
 
     def get_ticket_comments(self, issue_key: str) -> List[Dict[str, Any]]:
         """Get comments for a ticket."""
@@ -118,66 +654,189 @@ class JiraClient:
         response.raise_for_status()
         return response.json().get("comments", [])
 
+    def _write(self, method: str, url: str, payload: Dict[str, Any]):
+        """Send a mutating request tagged with an idempotency key and return the response.
+
+        The key is derived from the request itself, so retries replay it
+        unchanged. Every call is sent: identical writes such as a repeated
+        comment or issue link are intentional, and Jira may ignore the header.
+        """
+        idempotency_key = _idempotency_key(method, url, payload)
+        response = self.session.request(
+            method,
+            url,
+            data=_json_body(payload),
+            headers={"X-Atlassian-Token": "no-check", "X-Idempotency-Key": idempotency_key},
+        )
+        if response.ok:
+            # Any write can change rank or backlog membership
+            self._backlog_cache = None
+            _remove_cache_json("backlog.json")
+        return response
+
     def update_ticket(self, issue_key: str, fields: Dict[str, Any]) -> bool:
         """Update ticket fields."""
-        response = self.session.put(
+        response = self._write(
+            "PUT",
             self._api_url(f"issue/{issue_key}"),
-            json={"fields": fields},
+            {"fields": fields},
         )
         response.raise_for_status()
         return True
 
     def add_label(self, issue_key: str, label: str) -> bool:
         """Add a label to a ticket."""
-        response = self.session.put(
+        response = self._write(
+            "PUT",
             self._api_url(f"issue/{issue_key}"),
-            json={"update": {"labels": [{"add": label}]}},
+            {"update": {"labels": [{"add": label}]}},
         )
         response.raise_for_status()
         return True
 
     def remove_label(self, issue_key: str, label: str) -> bool:
         """Remove a label from a ticket."""
-        response = self.session.put(
+        response = self._write(
+            "PUT",
             self._api_url(f"issue/{issue_key}"),
-            json={"update": {"labels": [{"remove": label}]}},
+            {"update": {"labels": [{"remove": label}]}},
         )
         response.raise_for_status()
         return True
 
     def add_comment(self, issue_key: str, body: str) -> Dict[str, Any]:
         """Add a comment to a ticket."""
-        response = self.session.post(
+        payload = {
+            "body": {
+                "type": "doc",
+                "version": 1,
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": [{"type": "text", "text": body}],
+                    }
+                ],
+            }
+        }
+        response = self._write(
+            "POST",
             self._api_url(f"issue/{issue_key}/comment"),
-            json={
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": body}],
-                        }
-                    ],
-                }
-            },
+            payload,
         )
         response.raise_for_status()
         return response.json()
 
-    def transition_ticket(self, issue_key: str, transition_name: str, resolution: Optional[str] = None) -> bool:
-        """Transition a ticket to a new status."""
-        # First, get available transitions
-        response = self.session.get(self._api_url(f"issue/{issue_key}/transitions"))
-        response.raise_for_status()
-        transitions = response.json().get("transitions", [])
+    def _transitions_data(self) -> Dict[str, Dict[str, Any]]:
+        """Transition cache, loaded from disk on first use.
 
-        # Find matching transition
-        transition_id = None
-        for t in transitions:
-            if t["name"].lower() == transition_name.lower():
-                transition_id = t["id"]
-                break
+        "issue_types" maps site/ISSUE-KEY to {"id": issue type id}, and
+        "workflows" maps site/PROJECT/type id to {"transitions": [...]} seen
+        for that workflow. Every entry carries its own "fetched_at" and is
+        dropped on load once older than TRANSITIONS_CACHE_TTL, so rewriting
+        the file for one entry doesn't extend the others.
+        """
+        if self._transitions_cache is None:
+            cached = _read_cache_json("transitions.json", float("inf")) or {}
+            cutoff = time.time() - TRANSITIONS_CACHE_TTL
+            self._transitions_cache = {
+                section: {
+                    key: entry
+                    for key, entry in (cached.get(section) or {}).items()
+                    if isinstance(entry, dict) and entry.get("fetched_at", 0) > cutoff
+                }
+                for section in ("issue_types", "workflows")
+            }
+        return self._transitions_cache
+
+    def _merge_issue_types(self, issues: Iterable[Dict[str, Any]]) -> bool:
+        """Record issue types in the in-memory cache; True if anything was new or changed."""
+        issue_types = self._transitions_data()["issue_types"]
+        now = int(time.time())
+        changed = False
+        for issue in issues:
+            type_id = ((issue.get("fields") or {}).get("issuetype") or {}).get("id")
+            key = f"{self.config.base_url}/{issue.get('key')}"
+            if type_id and issue.get("key") and (issue_types.get(key) or {}).get("id") != type_id:
+                issue_types[key] = {"id": type_id, "fetched_at": now}
+                changed = True
+        return changed
+
+    def _note_issue_types(self, issues: Iterable[Dict[str, Any]]):
+        """Remember the issue types of fetched tickets so their workflow can be looked up offline.
+
+        Call once per batch: the cache file is rewritten at most once per call.
+        """
+        with self._transitions_lock:
+            if self._merge_issue_types(issues):
+                _write_cache_json("transitions.json", self._transitions_cache)
+
+    def _workflow_key(self, issue_key: str) -> Optional[str]:
+        """Cache key for a ticket's workflow (site, project and issue type), or None if its type is unknown."""
+        entry = self._transitions_data()["issue_types"].get(f"{self.config.base_url}/{issue_key}")
+        if entry is None:
+            return None
+        return f"{self.config.base_url}/{issue_key.rsplit('-', 1)[0]}/{entry['id']}"
+
+    def _cached_transitions(self, issue_key: str) -> List[Dict[str, str]]:
+        """Get transitions previously seen for the ticket's workflow."""
+        workflow_key = self._workflow_key(issue_key)
+        if workflow_key is None:
+            return []
+        return (self._transitions_data()["workflows"].get(workflow_key) or {}).get("transitions", [])
+
+    def _fetch_transitions(self, issue_key: str) -> List[Dict[str, str]]:
+        """Get transitions available for a ticket and merge them into the cache."""
+        # One request returns both the issue type (to key the cache) and the transitions
+        response = self.session.get(
+            self._api_url(f"issue/{issue_key}"),
+            params={"fields": "issuetype", "expand": "transitions"},
+        )
+        response.raise_for_status()
+        issue = response.json()
+        transitions = [
+            {"id": t["id"], "name": t["name"]}
+            for t in issue.get("transitions", [])
+        ]
+        with self._transitions_lock:
+            self._merge_issue_types([issue])
+            # Keep transitions seen from other statuses of the same workflow too
+            workflow_key = self._workflow_key(issue_key)
+            if workflow_key is not None:
+                workflows = self._transitions_data()["workflows"]
+                merged = {t["name"].lower(): t for t in self._cached_transitions(issue_key)}
+                merged.update((t["name"].lower(), t) for t in transitions)
+                workflows[workflow_key] = {
+                    "transitions": list(merged.values()),
+                    "fetched_at": int(time.time()),
+                }
+            _write_cache_json("transitions.json", self._transitions_cache)
+        return transitions
+
+    def transition_ticket(
+        self,
+        issue_key: str,
+        transition_name: str,
+        resolution: Optional[str] = None,
+        refresh: bool = False,
+    ) -> bool:
+        """Transition a ticket to a new status.
+
+        Transition ids are cached per workflow (project and issue type), so the
+        lookup round-trip is skipped for tickets whose type is already known,
+        e.g. from get-backlog or get-ticket; pass refresh=True to re-read them
+        from Jira.
+        """
+        def find_transition(transitions):
+            for t in transitions:
+                if t["name"].lower() == transition_name.lower():
+                    return t["id"]
+            return None
+
+        transition_id = None if refresh else find_transition(self._cached_transitions(issue_key))
+        from_cache = transition_id is not None
+        if not from_cache:
+            transitions = self._fetch_transitions(issue_key)
+            transition_id = find_transition(transitions)
 
         if not transition_id:
             available = [t["name"] for t in transitions]
@@ -188,10 +847,14 @@ class JiraClient:
         if resolution:
             payload["fields"] = {"resolution": {"name": resolution}}
 
-        response = self.session.post(
+        response = self._write(
+            "POST",
             self._api_url(f"issue/{issue_key}/transitions"),
-            json=payload,
+            payload,
         )
+        if response.status_code == 400 and from_cache:
+            # Cached id not valid from this ticket's current status; look it up fresh
+            return self.transition_ticket(issue_key, transition_name, resolution, refresh=True)
         response.raise_for_status()
         return True
 
@@ -200,22 +863,26 @@ class JiraClient:
         Move ticket position in backlog.
         Uses Jira Agile API to rerank issues.
         """
-        # Get current backlog to find reference issues
-        issues = self.search_issues(self.config.backlog_jql, max_results=spots + 50)
+        # Get current backlog to find reference issues, reusing a just-fetched one
+        # if it reaches far enough past the issue
+        keys = self._recent_backlog()
+        if (
+            keys is None
+            or issue_key not in keys
+            or (direction == "down" and keys.index(issue_key) + spots >= len(keys))
+        ):
+            issues = self.search_issues(self.config.backlog_jql, limit=spots + 50, fields=["summary"])
+            keys = [issue["key"] for issue in issues]
+            self._remember_backlog(keys)
 
         # Find current position
-        current_pos = None
-        for i, issue in enumerate(issues):
-            if issue["key"] == issue_key:
-                current_pos = i
-                break
-
-        if current_pos is None:
+        if issue_key not in keys:
             raise ValueError(f"Issue {issue_key} not found in backlog")
+        current_pos = keys.index(issue_key)
 
         # Calculate new position
         if direction == "down":
-            new_pos = min(current_pos + spots, len(issues) - 1)
+            new_pos = min(current_pos + spots, len(keys) - 1)
         else:
             new_pos = max(current_pos - spots, 0)
 
@@ -223,43 +890,42 @@ class JiraClient:
             return True  # Already at target position
 
         # Get the issue to rank before/after
-        if direction == "down" and new_pos < len(issues):
-            rank_after = issues[new_pos]["key"]
+        if direction == "down" and new_pos < len(keys):
+            rank_after = keys[new_pos]
             payload = {"issues": [issue_key], "rankAfterIssue": rank_after}
         elif direction == "up" and new_pos > 0:
-            rank_before = issues[new_pos - 1]["key"]
+            rank_before = keys[new_pos - 1]
             payload = {"issues": [issue_key], "rankBeforeIssue": rank_before}
         else:
             return True  # Edge case, already at boundary
 
-        response = self.session.put(self._agile_url("issue/rank"), json=payload)
+        response = self._write("PUT", self._agile_url("issue/rank"), payload)
         response.raise_for_status()
         return True
 
     def search_epics(self, query: str) -> List[Dict[str, Any]]:
         """Search for epics matching a query."""
         jql = f"project = {self.config.project_key} AND type = Epic AND summary ~ '{query}' ORDER BY updated DESC"
-        return self.search_issues(jql, max_results=10)
+        return list(self.search_issues(jql, limit=10, fields=["summary"]))
 
     def link_to_epic(self, issue_key: str, epic_key: str) -> bool:
         """Link an issue to an epic (set parent)."""
-        response = self.session.put(
+        response = self._write(
+            "PUT",
             self._api_url(f"issue/{issue_key}"),
-            json={"fields": {"parent": {"key": epic_key}}},
+            {"fields": {"parent": {"key": epic_key}}},
         )
         response.raise_for_status()
         return True
 
     def create_issue_link(self, from_key: str, to_key: str, link_type: str = "Relates") -> bool:
         """Create a link between two issues."""
-        response = self.session.post(
-            self._api_url("issueLink"),
-            json={
-                "type": {"name": link_type},
-                "inwardIssue": {"key": from_key},
-                "outwardIssue": {"key": to_key},
-            },
-        )
+        payload = {
+            "type": {"name": link_type},
+            "inwardIssue": {"key": from_key},
+            "outwardIssue": {"key": to_key},
+        }
+        response = self._write("POST", self._api_url("issueLink"), payload)
         response.raise_for_status()
         return True
 
@@ -268,77 +934,155 @@ class JiraClient:
         return f"{self.config.base_url}/browse/{issue_key}"
 
 
-def text_to_adf_content(text: str) -> List[Dict[str, Any]]:
-    """Convert text with URLs to ADF content nodes with proper link marks.
+class AsyncJiraClient:
+    """Async Jira Cloud REST API client for concurrent bulk reads.
 
-    URLs in the text will become clickable links in Jira.
-    Supports markdown-style links [text](url) and plain URLs.
+    Requires httpx with HTTP/2 support (`pip install "httpx[http2]"`).
+    Use as an async context manager so the connection pool is closed.
+    At most max_concurrency requests are in flight; 429/5xx responses are
+    retried like JiraClient's.
     """
-    # Pattern for markdown links [text](url)
-    md_link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    # Pattern for plain URLs
-    url_pattern = r'(https?://[^\s<>\[\]]+)'
 
-    nodes = []
+    def __init__(self, config: Optional[JiraConfig] = None, max_concurrency: int = 10):
+        import asyncio
+        import httpx
 
-    # First, handle markdown-style links
-    last_end = 0
-    for match in re.finditer(md_link_pattern, text):
-        # Add text before the link
-        if match.start() > last_end:
-            before_text = text[last_end:match.start()]
-            # Process plain URLs in the before_text
-            nodes.extend(_process_plain_urls(before_text))
+        self.config = config or JiraConfig.from_env()
+        self.client = httpx.AsyncClient(
+            headers={
+                "Authorization": self.config.auth_header,
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            http2=True,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            timeout=30,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Add the markdown link
-        link_text = match.group(1)
-        link_url = match.group(2)
-        nodes.append({
-            "type": "text",
-            "text": link_text,
-            "marks": [{"type": "link", "attrs": {"href": link_url}}]
-        })
-        last_end = match.end()
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
 
-    # Handle remaining text after last markdown link
-    if last_end < len(text):
-        remaining = text[last_end:]
-        nodes.extend(_process_plain_urls(remaining))
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+
+    def _api_url(self, path: str) -> str:
+        """Build full API URL."""
+        return f"{self.config.base_url}/rest/api/3/{path.lstrip('/')}"
 
-    # If no nodes were created (no links), just return plain text
-    if not nodes and text:
-        return [{"type": "text", "text": text}]
+    async def _get(self, url: str, **kwargs):
+        """GET within the concurrency limit, retrying rate limits and gateway errors."""
+        import asyncio
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                response = await self.client.get(url, **kwargs)
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def search_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Search for issues using JQL, yielding them one page at a time.
+
+        Async counterpart of JiraClient.search_issues.
+        """
+        pager = _SearchPager(jql, page_size, limit, fields)
+        for params in pager.pages():
+            response = await self._get(self._api_url("search/jql"), params=params)
+            response.raise_for_status()
+            for issue in pager.advance(response.json()):
+                yield issue
+
+    async def get_ticket(self, issue_key: str, expand: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """Get ticket details, optionally expanding extra data (see FULL_EXPAND)."""
+        response = await self._get(
+            self._api_url(f"issue/{issue_key}"),
+            params={"expand": ",".join(expand)} if expand else None,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def get_ticket_comments(self, issue_key: str) -> List[Dict[str, Any]]:
+        """Get comments for a ticket."""
+        response = await self._get(self._api_url(f"issue/{issue_key}/comment"))
+        response.raise_for_status()
+        return response.json().get("comments", [])
 
-    return nodes
 
+def get_tickets_concurrently(issue_keys: List[str], expand: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """Fetch several tickets at once, overlapping the network round-trips.
+
+    Uses AsyncJiraClient when httpx[http2] is installed, otherwise falls back
+    to JiraClient.bulk_get_tickets.
+    """
+    import asyncio
+
+    try:
+        import h2  # noqa: F401 - required by httpx for http2=True
+        import httpx  # noqa: F401
+    except ImportError:
+        return get_client().bulk_get_tickets(issue_keys, expand=expand)
+
+    async def gather_tickets():
+        async with AsyncJiraClient() as client:
+            return await asyncio.gather(*(client.get_ticket(key, expand) for key in issue_keys))
+
+    return asyncio.run(gather_tickets())
+
+
+_client: Optional[JiraClient] = None
+
+
+def get_client() -> JiraClient:
+    """Return the shared JiraClient, creating it on first use.
+
+    Reusing one client reuses its session, so chained calls ride the same
+    pooled TCP/TLS connection instead of handshaking again.
+    """
+    global _client
+    if _client is None:
+        _client = JiraClient()
+    return _client
 
-def _process_plain_urls(text: str) -> List[Dict[str, Any]]:
-    """Process plain URLs in text and convert them to link nodes."""
-    url_pattern = r'(https?://[^\s<>\[\]]+)'
+
+def text_to_adf_content(text: str) -> List[Dict[str, Any]]:
+    """Convert text with URLs to ADF content nodes with proper link marks.
+
+    URLs in the text will become clickable links in Jira.
+    Supports markdown-style links [text](url) and plain URLs.
+    """
     nodes = []
     last_end = 0
 
-    for match in re.finditer(url_pattern, text):
-        # Add text before the URL
+    # Single pass: each match is either a markdown link or a plain URL
+    for match in _ADF_LINK_RE.finditer(text):
+        # Add text before the link
         if match.start() > last_end:
-            before_text = text[last_end:match.start()]
-            if before_text:
-                nodes.append({"type": "text", "text": before_text})
+            nodes.append({"type": "text", "text": text[last_end:match.start()]})
 
-        # Add the URL as a link
-        url = match.group(1)
+        if match.lastgroup == "url":
+            link_text = link_url = match["url"]
+        else:
+            link_text, link_url = match["md_text"], match["md_url"]
         nodes.append({
             "type": "text",
-            "text": url,
-            "marks": [{"type": "link", "attrs": {"href": url}}]
+            "text": link_text,
+            "marks": [{"type": "link", "attrs": {"href": link_url}}]
         })
         last_end = match.end()
 
     # Add remaining text
     if last_end < len(text):
-        remaining = text[last_end:]
-        if remaining:
-            nodes.append({"type": "text", "text": remaining})
+        nodes.append({"type": "text", "text": text[last_end:]})
 
     return nodes
 
@@ -395,7 +1139,7 @@ def format_ticket_for_display(ticket: Dict[str, Any]) -> str:
     if description:
         if isinstance(description, dict):
             # ADF format - extract text
-            desc_text = extract_adf_text(description)
+            desc_text = _fast_adf_plain(description) or extract_adf_text(description)
         else:
             desc_text = description
 
@@ -430,6 +1174,132 @@ def format_ticket_for_display(ticket: Dict[str, Any]) -> str:
     return md
 
 
+def _fast_adf_plain(adf: Dict[str, Any]) -> Optional[str]:
+    """Text of an ADF doc made only of plain, unmarked paragraphs, else None.
+
+    Gives the same result as extract_adf_text for that common shape without
+    walking the tree.
+    """
+    if adf.get("type") != "doc":
+        return None
+    paragraphs = []
+    for paragraph in adf.get("content") or []:
+        if not isinstance(paragraph, dict) or paragraph.get("type") != "paragraph":
+            return None
+        parts = []
+        for node in paragraph.get("content") or []:
+            if not isinstance(node, dict) or node.get("type") != "text" or node.get("marks"):
+                return None
+            parts.append(node.get("text", ""))
+        text = "".join(parts)
+        # Empty paragraphs and embedded newlines need extract_adf_text's blank-line handling
+        if not text or "\n" in text:
+            return None
+        paragraphs.append(text)
+    return "\n".join(paragraphs).strip()
+
+
+def _adf_children(node: Dict[str, Any]) -> List[Tuple[Any, str]]:
+    """Stack entries for a node's children (no list prefix)."""
+    return [(child, "") for child in node.get("content") or []]
+
+
+def _adf_text(node, list_prefix, emit, push):
+    text = node.get("text", "")
+    marks = node.get("marks") or []
+
+    # Check for link mark (filter out None marks)
+    link_mark = next((m for m in marks if m and m.get("type") == "link"), None)
+    if link_mark:
+        attrs = link_mark.get("attrs") or {}
+        href = attrs.get("href", "")
+        if href:
+            emit(f"[{text}]({href})")
+        else:
+            emit(text)
+    else:
+        emit(text)
+
+
+def _adf_inline_card(node, list_prefix, emit, push):
+    # Jira ticket references and other inline cards
+    attrs = node.get("attrs") or {}
+    url = attrs.get("url", "")
+    if url:
+        # Extract ticket key from Jira URL if possible
+        # URLs look like: https://company.atlassian.net/browse/PROJ-123
+        if "/browse/" in url:
+            ticket_key = url.split("/browse/")[-1].split("?")[0]
+            emit(f"[{ticket_key}]({url})")
+        else:
+            emit(f"[link]({url})")
+
+
+def _adf_mention(node, list_prefix, emit, push):
+    # @mentions
+    attrs = node.get("attrs") or {}
+    mention_text = attrs.get("text", "")
+    account_id = attrs.get("id", "")
+    if mention_text:
+        emit(f"@{mention_text}")
+    elif account_id:
+        emit(f"@{account_id}")
+
+
+def _adf_hard_break(node, list_prefix, emit, push):
+    emit("\n")
+
+
+def _adf_paragraph(node, list_prefix, emit, push):
+    push(*_adf_children(node), "\n")
+
+
+def _adf_bullet_list(node, list_prefix, emit, push):
+    push(*[(item, "- ") for item in node.get("content") or []])
+
+
+def _adf_ordered_list(node, list_prefix, emit, push):
+    content = node.get("content") or []
+    push(*[(item, f"{i}. ") for i, item in enumerate(content, 1)])
+
+
+def _adf_list_item(node, list_prefix, emit, push):
+    emit(list_prefix)
+    push(*_adf_children(node))
+
+
+def _adf_heading(node, list_prefix, emit, push):
+    attrs = node.get("attrs") or {}
+    level = attrs.get("level", 1)
+    emit("#" * level + " ")
+    push(*_adf_children(node), "\n")
+
+
+def _adf_code_block(node, list_prefix, emit, push):
+    emit("```\n")
+    push(*_adf_children(node), "\n```\n")
+
+
+def _adf_container(node, list_prefix, emit, push):
+    # Any other node: just descend into its content, if it has any
+    push(*_adf_children(node))
+
+
+# ADF node type -> handler(node, list_prefix, emit, push)
+_ADF_HANDLERS = {
+    "text": _adf_text,
+    "inlineCard": _adf_inline_card,
+    "mention": _adf_mention,
+    "hardBreak": _adf_hard_break,
+    "paragraph": _adf_paragraph,
+    "bulletList": _adf_bullet_list,
+    "orderedList": _adf_ordered_list,
+    "listItem": _adf_list_item,
+    "heading": _adf_heading,
+    "codeBlock": _adf_code_block,
+}
+
+
 def extract_adf_text(adf: Dict[str, Any]) -> str:
     """Extract text from Atlassian Document Format, preserving links and mentions as markdown.
 
@@ -444,111 +1314,44 @@ def extract_adf_text(adf: Dict[str, Any]) -> str:
         return ""
 
     text_parts = []
-
-    def extract_content(node, list_prefix=""):
-        # Skip None nodes
-        if node is None:
-            return
-
+    # Consecutive newlines at the end of text_parts; runs are capped at two (one blank line)
+    trailing_newlines = 0
+
+    def emit(text):
+        nonlocal trailing_newlines
+        body = text.lstrip("\n")
+        newlines = min(len(text) - len(body), 2 - trailing_newlines)
+        if newlines > 0:
+            text_parts.append("\n" * newlines)
+            trailing_newlines += newlines
+        if body:
+            if "\n\n\n" in body:
+                body = _BLANK_LINES_RE.sub("\n\n", body)
+            text_parts.append(body)
+            trailing_newlines = len(body) - len(body.rstrip("\n"))
+
+    # Walk the tree with an explicit stack of (node, list_prefix) entries; plain
+    # strings on the stack are literal text emitted once the nodes above them are done.
+    stack = deque([(adf, "")])
+
+    def push(*entries):
+        # Reverse so entries are visited in the order given
+        stack.extend(reversed(entries))
+
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            emit(entry)
+            continue
+
+        node, list_prefix = entry
         if isinstance(node, dict):
-            node_type = node.get("type")
-
-            if node_type == "text":
-                text = node.get("text", "")
-                marks = node.get("marks") or []
-
-                # Check for link mark (filter out None marks)
-                link_mark = next((m for m in marks if m and m.get("type") == "link"), None)
-                if link_mark:
-                    attrs = link_mark.get("attrs") or {}
-                    href = attrs.get("href", "")
-                    if href:
-                        text_parts.append(f"[{text}]({href})")
-                    else:
-                        text_parts.append(text)
-                else:
-                    text_parts.append(text)
-
-            elif node_type == "inlineCard":
-                # Jira ticket references and other inline cards
-                attrs = node.get("attrs") or {}
-                url = attrs.get("url", "")
-                if url:
-                    # Extract ticket key from Jira URL if possible
-                    # URLs look like: https://company.atlassian.net/browse/PROJ-123
-                    if "/browse/" in url:
-                        ticket_key = url.split("/browse/")[-1].split("?")[0]
-                        text_parts.append(f"[{ticket_key}]({url})")
-                    else:
-                        text_parts.append(f"[link]({url})")
-
-            elif node_type == "mention":
-                # @mentions
-                attrs = node.get("attrs") or {}
-                mention_text = attrs.get("text", "")
-                account_id = attrs.get("id", "")
-                if mention_text:
-                    text_parts.append(f"@{mention_text}")
-                elif account_id:
-                    text_parts.append(f"@{account_id}")
-
-            elif node_type == "hardBreak":
-                text_parts.append("\n")
-
-            elif node_type == "paragraph":
-                content = node.get("content") or []
-                for child in content:
-                    extract_content(child)
-                text_parts.append("\n")
-
-            elif node_type == "bulletList":
-                content = node.get("content") or []
-                for item in content:
-                    extract_content(item, list_prefix="- ")
-
-            elif node_type == "orderedList":
-                content = node.get("content") or []
-                for i, item in enumerate(content, 1):
-                    extract_content(item, list_prefix=f"{i}. ")
-
-            elif node_type == "listItem":
-                text_parts.append(list_prefix)
-                content = node.get("content") or []
-                for child in content:
-                    extract_content(child)
-
-            elif node_type == "heading":
-                attrs = node.get("attrs") or {}
-                level = attrs.get("level", 1)
-                text_parts.append("#" * level + " ")
-                content = node.get("content") or []
-                for child in content:
-                    extract_content(child)
-                text_parts.append("\n")
-
-            elif node_type == "codeBlock":
-                text_parts.append("```\n")
-                content = node.get("content") or []
-                for child in content:
-                    extract_content(child)
-                text_parts.append("\n```\n")
-
-            elif "content" in node:
-                content = node.get("content") or []
-                for child in content:
-                    extract_content(child)
-
+            _ADF_HANDLERS.get(node.get("type"), _adf_container)(node, list_prefix, emit, push)
         elif isinstance(node, list):
-            for item in node:
-                extract_content(item)
-
-    extract_content(adf)
+            push(*[(item, "") for item in node])
+        # Anything else (e.g. None nodes) is skipped
 
-    # Clean up extra newlines
-    result = "".join(text_parts)
-    while "\n\n\n" in result:
-        result = result.replace("\n\n\n", "\n\n")
-    return result.strip()
+    return "".join(text_parts).strip()
 
 
 def main():
@@ -566,10 +1369,16 @@ def main():
     get_parser.add_argument("issue_key", help="Issue key (e.g., PROJ-123)")
     get_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # Get several tickets concurrently
+    tickets_parser = subparsers.add_parser("get-tickets", help="Get details for several tickets at once")
+    tickets_parser.add_argument("issue_keys", nargs="+", help="Issue keys (e.g., PROJ-123 PROJ-124)")
+    tickets_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     # Get backlog
     backlog_parser = subparsers.add_parser("get-backlog", help="Get backlog tickets")
     backlog_parser.add_argument("--limit", type=int, default=10, help="Max tickets to fetch")
     backlog_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    backlog_parser.add_argument("--full", action="store_true", help="Fetch full details for each ticket")
 
     # Add label
     label_parser = subparsers.add_parser("add-label", help="Add label to ticket")
@@ -617,26 +1426,44 @@ def main():
         return
 
     try:
-        client = JiraClient()
+        if args.command == "get-tickets":
+            # Only needs the sync client as a fallback (see get_tickets_concurrently)
+            tickets = get_tickets_concurrently(args.issue_keys, FULL_EXPAND if args.json else ())
+            if args.json:
+                print(json_pretty(tickets))
+            else:
+                for ticket in tickets:
+                    print(format_ticket_for_display(ticket))
+            return
+
+        client = get_client()
 
         if args.command == "test-connection":
             success = client.test_connection()
             sys.exit(0 if success else 1)
 
         elif args.command == "get-ticket":
-            ticket = client.get_ticket(args.issue_key)
             if args.json:
-                print(json.dumps(ticket, indent=2))
+                # Pass Jira's response straight through rather than parsing and re-encoding it
+                client.write_ticket_json(args.issue_key, sys.stdout.buffer)
+                sys.stdout.buffer.write(b"\n")
             else:
-                print(format_ticket_for_display(ticket))
+                print(format_ticket_for_display(client.get_ticket(args.issue_key)))
 
         elif args.command == "get-backlog":
             tickets = client.get_backlog_tickets(args.limit)
+            if args.full:
+                expand = FULL_EXPAND if args.json else ()
+                tickets = client.bulk_get_tickets([t["key"] for t in tickets], expand=expand)
             if args.json:
-                print(json.dumps(tickets, indent=2))
-            else:
+                print(json_pretty(tickets))
+            elif args.full:
                 for t in tickets:
-                    print(f"{t['key']}: {t['fields']['summary']}")
+                    print(format_ticket_for_display(t))
+            else:
+                view = BacklogView.from_issues(tickets)
+                for key, summary in zip(view.keys, view.summaries):
+                    print(f"{key}: {summary}")
 
         elif args.command == "add-label":
             client.add_label(args.issue_key, args.label)